@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Shared batch setup for the test scripts
+Runs a test batch on the shared processor and worker pool in a scratch
+directory, then keeps the outputs for inspection
+"""
+
+import contextlib
+import os
+import tempfile
+from check_batch_processor import DEFAULT_CACHE_DIR, get_default_processor, get_pool
+from output_sync import mirror_directory
+
+def start_pool():
+    """Start the pool workers now, so they boot while the test images are built."""
+    get_pool(warm=True)
+
+@contextlib.contextmanager
+def processed_batch(sources: list, keep_dir: str, auto_rotate: bool = True, level_background: bool = True):
+    """Process a test batch in a scratch directory and yield the results.
+
+    sources is a list of image paths, or of (filename, image) pairs for
+    in-memory images. Once the caller is done with the results, the batch
+    outputs are mirrored to keep_dir and the scratch directory is removed.
+
+    Results cached by earlier runs are only reused when the
+    CHECK_RESIZER_TEST_CACHE environment variable is set, so the pipeline
+    itself normally runs.
+    """
+    processor = get_default_processor()
+    processor.cache_dir = DEFAULT_CACHE_DIR if os.environ.get('CHECK_RESIZER_TEST_CACHE') else None
+    processor.auto_rotate = auto_rotate
+    processor.level_background = level_background
+
+    with tempfile.TemporaryDirectory(prefix="chk-") as work_dir:
+        if all(isinstance(source, str) for source in sources):
+            results = processor.process_batch(sources, work_dir, executor=get_pool())
+        else:
+            results = processor.process_batch_arrays(sources, work_dir, executor=get_pool())
+
+        yield results
+
+        mirror_directory(work_dir, keep_dir)
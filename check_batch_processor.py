@@ -12,6 +12,12 @@ import tempfile
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 import json
+import sys
+import hashlib
+import shutil
+import atexit
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import letter, A4
@@ -119,6 +125,35 @@ class CheckClassifier:
             'filename': filename
         }
 
+# Per-user cache directory for this tool
+CACHE_ROOT = Path(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache')) / 'check-resize-tool'
+
+# Default location for CheckBatchProcessor.cache_dir
+DEFAULT_CACHE_DIR = CACHE_ROOT / 'batch'
+
+# Bump when the cached result format changes. Edits to the resizing and
+# classification code and OpenCV/NumPy upgrades are picked up by _code_fingerprint().
+CACHE_VERSION = 1
+
+_code_fingerprint_value = None
+
+def _code_fingerprint() -> Tuple[str, str, str]:
+    """Identify the code behind a cached result, computed on first use.
+    
+    Returns a hash of check_resizer.py and this module, and the OpenCV and
+    NumPy versions, so results from other code are never reused.
+    """
+    global _code_fingerprint_value
+    
+    if _code_fingerprint_value is None:
+        digest = hashlib.blake2b(digest_size=16)
+        for module_file in (sys.modules[CheckResizer.__module__].__file__, __file__):
+            with open(module_file, 'rb') as f:
+                digest.update(f.read())
+        _code_fingerprint_value = (digest.hexdigest(), cv2.__version__, np.__version__)
+    
+    return _code_fingerprint_value
+
 class CheckBatchProcessor:
     """Process multiple checks and create print-ready layouts."""
     
@@ -139,9 +174,143 @@ class CheckBatchProcessor:
             'checks_per_page': 3,
             'spacing': 0.25       # 0.25" between checks
         }
+        
+        # Directory for caching per-image results between runs (None disables it)
+        self.cache_dir = None
+    
+    def _processing_settings(self) -> Dict:
+        """Return the per-image processing settings, for handing to pool workers."""
+        return {
+            'auto_rotate': self.auto_rotate,
+            'level_background': self.level_background,
+            'level_method': self.level_method,
+            'level_intensity': self.level_intensity,
+            'cache_dir': self.cache_dir
+        }
+    
+    def clear_cache(self):
+        """Delete all cached per-image results."""
+        if self.cache_dir:
+            shutil.rmtree(self.cache_dir, ignore_errors=True)
+    
+    def _cache_key(self, image_path: str, image: Optional[np.ndarray]) -> str:
+        """Hash the input image and everything that affects its result."""
+        if image is None:
+            with open(image_path, 'rb') as f:
+                data = f.read()
+        else:
+            data = repr((image.shape, image.dtype.str)).encode() + image.tobytes()
+        
+        settings = self._processing_settings()
+        del settings['cache_dir']
+        config = repr((CACHE_VERSION, _code_fingerprint(), sorted(settings.items()), CheckClassifier.CHECK_TYPES))
+        
+        return hashlib.blake2b(data + config.encode(), digest_size=16).hexdigest()
+    
+    def _process_image(self, image_path: str, image: Optional[np.ndarray] = None) -> Dict:
+        """Resize and classify a single check image, using the cache when enabled.
+        
+        If image is given it is used as-is and image_path only names the check;
+        otherwise the image is read from image_path.
+        """
+        if not self.cache_dir:
+            return self._resize_and_classify(image_path, image)
+        
+        key = self._cache_key(image_path, image)
+        cached_png = Path(self.cache_dir) / f"{key}.png"
+        cached_json = Path(self.cache_dir) / f"{key}.json"
+        
+        if cached_json.exists() and cached_png.exists():
+            with open(cached_json) as f:
+                classification = json.load(f)
+            classification['filename'] = Path(image_path).name
+            print(f"  ♻️  Using cached result")
+            return {
+                'original_path': image_path,
+                'processed_path': str(cached_png),
+                'classification': classification
+            }
+        
+        check_info = self._resize_and_classify(image_path, image)
+        
+        # Write the image first and the JSON last, so a JSON file always has its image
+        os.makedirs(self.cache_dir, exist_ok=True)
+        temp_suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+        shutil.copyfile(check_info['processed_path'], str(cached_png) + temp_suffix)
+        os.replace(str(cached_png) + temp_suffix, cached_png)
+        with open(str(cached_json) + temp_suffix, 'w') as f:
+            json.dump(check_info['classification'], f)
+        os.replace(str(cached_json) + temp_suffix, cached_json)
+        
+        return check_info
+    
+    def _resize_and_classify(self, image_path: str, image: Optional[np.ndarray] = None) -> Dict:
+        """Resize and classify a single check image."""
+        
+        resize_options = dict(
+            preview=False,
+            level_background=self.level_background,
+            level_method=self.level_method,
+            level_intensity=self.level_intensity,
+            auto_rotate=self.auto_rotate
+        )
+        
+        # Resize/crop the image
+        temp_output = tempfile.NamedTemporaryFile(suffix='.png', delete=False)
+        if image is None:
+            # Load and process image
+            image = cv2.imread(image_path)
+            if image is None:
+                raise ValueError(f"Could not load image: {image_path}")
+            
+            success = self.resizer.resize_image(image_path, temp_output.name, **resize_options)
+        else:
+            success = self.resizer.resize_array(image, temp_output.name, **resize_options)
+        
+        if not success:
+            print(f"  ⚠️  Auto-resize failed, using original")
+            # Use original if auto-resize fails
+            processed_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+            temp_output = tempfile.NamedTemporaryFile(suffix='.png', delete=False)
+            Image.fromarray(processed_image).save(temp_output.name)
+        else:
+            print(f"  ✅ Auto-resized successfully")
+        
+        # Load processed image for classification
+        processed_image = cv2.imread(temp_output.name)
+        
+        # Classify check type
+        classification = self.classifier.classify_check(
+            processed_image, 
+            Path(image_path).name
+        )
+        
+        return {
+            'original_path': image_path,
+            'processed_path': temp_output.name,
+            'classification': classification
+        }
+    
+    def process_batch(self, image_paths: List[str], output_dir: str, executor: Optional[Executor] = None) -> Dict:
+        """Process a batch of check images.
+        
+        If an executor is given (see get_pool), images are resized and
+        classified on its workers; PDFs and reports are always built here.
+        """
+        return self._run_batch([(image_path, None) for image_path in image_paths], output_dir, executor)
+    
+    def process_batch_arrays(self, images: List[Tuple[str, np.ndarray]], output_dir: str, executor: Optional[Executor] = None) -> Dict:
+        """Process a batch of already-loaded check images.
+        
+        Takes (name, BGR array) pairs, so callers holding images in memory
+        can skip writing and re-reading them. Otherwise like process_batch.
+        """
+        return self._run_batch(images, output_dir, executor)
     
-    def process_batch(self, image_paths: List[str], output_dir: str) -> Dict:
-        """Process a batch of check images."""
+    def _run_batch(self, sources: List[Tuple[str, Optional[np.ndarray]]], output_dir: str, executor: Optional[Executor]) -> Dict:
+        """Process (path, image-or-None) pairs and build the PDFs and reports."""
+        
+        image_paths = [image_path for image_path, _ in sources]
         
         print("🔄 Processing batch of check images...")
         print(f"📁 Input: {len(image_paths)} images")
@@ -159,55 +328,24 @@ class CheckBatchProcessor:
         
         processed_images = []
         
-        for i, image_path in enumerate(image_paths):
+        if executor is not None:
+            settings = self._processing_settings()
+            futures = [executor.submit(_process_one, image_path, settings, image) for image_path, image in sources]
+        
+        for i, (image_path, image) in enumerate(sources):
             try:
                 print(f"\n📋 Processing {i+1}/{len(image_paths)}: {Path(image_path).name}")
                 
-                # Load and process image
-                image = cv2.imread(image_path)
-                if image is None:
-                    raise ValueError(f"Could not load image: {image_path}")
-                
-                # Resize/crop the image
-                temp_output = tempfile.NamedTemporaryFile(suffix='.png', delete=False)
-                success = self.resizer.resize_image(
-                    image_path, 
-                    temp_output.name,
-                    preview=False,
-                    level_background=self.level_background,
-                    level_method=self.level_method,
-                    level_intensity=self.level_intensity,
-                    auto_rotate=self.auto_rotate
-                )
-                
-                if not success:
-                    print(f"  ⚠️  Auto-resize failed, using original")
-                    # Use original if auto-resize fails
-                    processed_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-                    temp_output = tempfile.NamedTemporaryFile(suffix='.png', delete=False)
-                    Image.fromarray(processed_image).save(temp_output.name)
+                if executor is not None:
+                    check_info = futures[i].result()
                 else:
-                    print(f"  ✅ Auto-resized successfully")
-                
-                # Load processed image for classification
-                processed_image = cv2.imread(temp_output.name)
-                
-                # Classify check type
-                classification = self.classifier.classify_check(
-                    processed_image, 
-                    Path(image_path).name
-                )
+                    check_info = self._process_image(image_path, image)
                 
+                classification = check_info['classification']
                 print(f"  📊 Type: {classification['type']} (confidence: {classification['confidence']:.0%})")
                 print(f"  📏 Size: {classification['dimensions']['width_inches']}\" x {classification['dimensions']['height_inches']}\"")
                 
                 # Store results
-                check_info = {
-                    'original_path': image_path,
-                    'processed_path': temp_output.name,
-                    'classification': classification
-                }
-                
                 processed_images.append(check_info)
                 results['processed_checks'].append(check_info)
                 
@@ -294,10 +432,21 @@ class CheckBatchProcessor:
         final_check_width = target_width_points * layout_scale
         final_check_height = target_height_points * layout_scale
         
+        page_count = (len(checks) + checks_per_page - 1) // checks_per_page
+        
+        def draw_page_footer(page_num):
+            c.setFont("Helvetica", 10)
+            c.drawRightString(
+                page_width - margin, margin / 2,
+                f"Page {page_num} of {page_count} | {check_type.title()} Checks"
+            )
+        
+        # One canvas for the whole group; each page gets its footer before showPage
         c = canvas.Canvas(pdf_path, pagesize=self.print_settings['page_size'])
         
         for i, check_info in enumerate(checks):
             if i % checks_per_page == 0 and i > 0:
+                draw_page_footer(i // checks_per_page)
                 c.showPage()  # New page
             
             position_on_page = i % checks_per_page
@@ -341,18 +490,7 @@ class CheckBatchProcessor:
                     f"Error loading: {Path(check_info['original_path']).name}"
                 )
         
-        # Add page numbers and metadata
-        page_count = (len(checks) + checks_per_page - 1) // checks_per_page
-        for page_num in range(1, page_count + 1):
-            if page_num > 1:
-                c.showPage()
-            
-            c.setFont("Helvetica", 10)
-            c.drawRightString(
-                page_width - margin, margin / 2,
-                f"Page {page_num} of {page_count} | {check_type.title()} Checks"
-            )
-        
+        draw_page_footer(page_count)
         c.save()
         return pdf_path
     
@@ -398,6 +536,86 @@ class CheckBatchProcessor:
                 for error in results['errors']:
                     f.write(f"• {error}\n")
 
+_default_processor = None
+_pool = None
+_pool_workers = 0
+
+# Each worker builds its own CheckBatchProcessor, so keep the default pool small
+DEFAULT_POOL_WORKERS = 4
+
+def get_default_processor() -> CheckBatchProcessor:
+    """Return a CheckBatchProcessor shared by the whole process.
+    
+    The processor is built on first use. Callers that need particular
+    settings (auto_rotate, level_background, ...) should set them on the
+    returned object before each batch.
+    """
+    global _default_processor
+    
+    if _default_processor is None:
+        _default_processor = CheckBatchProcessor()
+    
+    return _default_processor
+
+_worker_state = threading.local()
+
+def _init_worker():
+    """Build a processor once per pool worker so later tasks skip the setup."""
+    _worker_state.processor = CheckBatchProcessor()
+
+def _process_one(image_path: str, settings: Dict, image: Optional[np.ndarray] = None) -> Dict:
+    """Pool task: resize and classify one image with the given settings."""
+    processor = getattr(_worker_state, 'processor', None)
+    if processor is None:
+        _init_worker()
+        processor = _worker_state.processor
+    
+    for name, value in settings.items():
+        setattr(processor, name, value)
+    
+    return processor._process_image(image_path, image)
+
+def _warmup(_=None):
+    """Pool task that does nothing; submitting it makes the pool start a worker."""
+    return None
+
+def _running_in_streamlit() -> bool:
+    """Return True when called from inside a running Streamlit app."""
+    if 'streamlit' not in sys.modules:
+        return False
+    try:
+        from streamlit import runtime
+        return runtime.exists()
+    except Exception:
+        return False
+
+def get_pool(max_workers: Optional[int] = None, warm: bool = False) -> Executor:
+    """Return a shared executor for CheckBatchProcessor.process_batch.
+    
+    The pool is created on first use and reused for the rest of the process,
+    so workers only pay the import and setup cost once. Inside Streamlit a
+    thread pool is used instead, since process pools do not work there.
+    
+    max_workers defaults to the CPU count, capped at DEFAULT_POOL_WORKERS.
+    With warm=True every worker is started right away, without waiting, so
+    callers can overlap worker startup with their own setup.
+    """
+    global _pool, _pool_workers
+    
+    if _pool is None:
+        _pool_workers = max_workers or min(os.cpu_count() or 1, DEFAULT_POOL_WORKERS)
+        if _running_in_streamlit():
+            _pool = ThreadPoolExecutor(max_workers=_pool_workers, initializer=_init_worker)
+        else:
+            _pool = ProcessPoolExecutor(max_workers=_pool_workers, initializer=_init_worker)
+        atexit.register(_pool.shutdown)
+    
+    if warm:
+        for _ in range(_pool_workers):
+            _pool.submit(_warmup)
+    
+    return _pool
+
 def main():
     """Example usage of the batch processor."""
     
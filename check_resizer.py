@@ -18,6 +18,7 @@ from PIL import Image
 import argparse
 import os
 import sys
+from functools import partial
 from pathlib import Path
 
 
@@ -42,7 +43,10 @@ class CheckResizer:
             
         # Convert PIL to OpenCV if needed
         if hasattr(image, 'mode'):  # PIL Image
-            cv_image = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
+            if image.mode != 'RGB':
+                image = image.convert('RGB')
+            # cvtColor writes a new array, so a read-only view of PIL's pixels is enough
+            cv_image = cv2.cvtColor(np.asarray(image), cv2.COLOR_RGB2BGR)
         else:
             cv_image = image.copy()
         
@@ -274,10 +278,14 @@ class CheckResizer:
             print(f"Error loading image {image_path}: {e}")
             return None, None
     
-    def preprocess_image(self, image):
-        """Preprocess image for better edge detection."""
+    def preprocess_image(self, image, gray=None):
+        """Preprocess image for better edge detection.
+        
+        Pass gray if the grayscale version of image has already been computed.
+        """
         # Convert to grayscale
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        if gray is None:
+            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
         
         # Apply Gaussian blur to reduce noise
         blurred = cv2.GaussianBlur(gray, (5, 5), 0)
@@ -288,9 +296,10 @@ class CheckResizer:
         
         return enhanced
     
-    def find_check_bounds_canny(self, image):
+    def find_check_bounds_canny(self, image, processed=None):
         """Find check boundaries using Canny edge detection."""
-        processed = self.preprocess_image(image)
+        if processed is None:
+            processed = self.preprocess_image(image)
         
         # Try multiple Canny threshold combinations for robustness
         threshold_pairs = [
@@ -346,9 +355,10 @@ class CheckResizer:
         
         return None
     
-    def find_check_bounds_threshold(self, image):
+    def find_check_bounds_threshold(self, image, processed=None):
         """Find check boundaries using adaptive thresholding."""
-        processed = self.preprocess_image(image)
+        if processed is None:
+            processed = self.preprocess_image(image)
         
         # Try different adaptive threshold approaches
         approaches = [
@@ -406,9 +416,10 @@ class CheckResizer:
         
         return None
     
-    def find_check_bounds_morphology(self, image):
+    def find_check_bounds_morphology(self, image, processed=None):
         """Find check boundaries using morphological operations."""
-        processed = self.preprocess_image(image)
+        if processed is None:
+            processed = self.preprocess_image(image)
         
         # Try different threshold methods
         threshold_methods = [
@@ -472,14 +483,15 @@ class CheckResizer:
         
         return None
     
-    def find_check_bounds_fallback(self, image):
+    def find_check_bounds_fallback(self, image, gray=None):
         """Fallback method using simple brightness analysis."""
         try:
             # Convert to grayscale if needed
-            if len(image.shape) == 3:
-                gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-            else:
-                gray = image.copy()
+            if gray is None:
+                if len(image.shape) == 3:
+                    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+                else:
+                    gray = image.copy()
             
             height, width = gray.shape
             
@@ -528,10 +540,11 @@ class CheckResizer:
         except Exception:
             return None
     
-    def find_check_bounds_edge_density(self, image):
+    def find_check_bounds_edge_density(self, image, processed=None):
         """Find bounds using edge density analysis."""
         try:
-            processed = self.preprocess_image(image)
+            if processed is None:
+                processed = self.preprocess_image(image)
             height, width = processed.shape
             
             # Apply Sobel edge detection
@@ -733,14 +746,24 @@ class CheckResizer:
             print(f"Warning: Auto-rotation failed: {e}")
             return image, 0
 
-    def analyze_image(self, image):
-        """Analyze image using multiple methods and return the best bounds."""
+    def analyze_image(self, image, log=print, gray=None):
+        """Analyze image using multiple methods and return the best bounds.
+        
+        Progress messages are passed to log (print by default). Pass gray if
+        the grayscale version of image has already been computed.
+        """
+        if gray is None:
+            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if len(image.shape) == 3 else image
+        
+        # The edge-based methods all start from the same enhanced grayscale image
+        processed = self.preprocess_image(image, gray=gray)
+        
         methods = [
-            ("Canny Edge Detection", self.find_check_bounds_canny),
-            ("Adaptive Threshold", self.find_check_bounds_threshold),
-            ("Morphological Operations", self.find_check_bounds_morphology),
-            ("Edge Density Analysis", self.find_check_bounds_edge_density),
-            ("Brightness Analysis (Fallback)", self.find_check_bounds_fallback),
+            ("Canny Edge Detection", partial(self.find_check_bounds_canny, processed=processed)),
+            ("Adaptive Threshold", partial(self.find_check_bounds_threshold, processed=processed)),
+            ("Morphological Operations", partial(self.find_check_bounds_morphology, processed=processed)),
+            ("Edge Density Analysis", partial(self.find_check_bounds_edge_density, processed=processed)),
+            ("Brightness Analysis (Fallback)", partial(self.find_check_bounds_fallback, gray=gray)),
         ]
         
         results = []
@@ -769,13 +792,13 @@ class CheckResizer:
                             'reduction': reduction
                         })
                         
-                        print(f"Method '{method_name}': bounds {bounds}, reduction {reduction:.1f}%")
+                        log(f"Method '{method_name}': bounds {bounds}, reduction {reduction:.1f}%")
             except Exception as e:
-                print(f"Method {method_name} failed: {e}")
+                log(f"Method {method_name} failed: {e}")
                 continue
         
         if not results:
-            print("No valid bounds found with any method")
+            log("No valid bounds found with any method")
             return None
         
         # Choose the method that gives reasonable reduction but not too aggressive
@@ -790,7 +813,7 @@ class CheckResizer:
         if best_result is None:
             best_result = max(results, key=lambda x: x['reduction'])
         
-        print(f"Selected method: {best_result['method']} "
+        log(f"Selected method: {best_result['method']} "
               f"(Area reduction: {best_result['reduction']:.1f}%)")
         
         return best_result['bounds']
@@ -804,6 +827,19 @@ class CheckResizer:
         if cv_image is None:
             return False
         
+        return self._crop_and_save(cv_image, pil_image, output_path, preview, level_background, level_method, level_intensity, auto_rotate)
+    
+    def resize_array(self, cv_image, output_path=None, preview=False, level_background=False, level_method='morphological', level_intensity='gentle', auto_rotate=True):
+        """Resize an already-loaded check image (OpenCV BGR array) by removing whitespace."""
+        if len(cv_image.shape) == 3:
+            pil_image = Image.fromarray(cv2.cvtColor(cv_image, cv2.COLOR_BGR2RGB))
+        else:
+            pil_image = Image.fromarray(cv_image, mode='L')
+        
+        return self._crop_and_save(cv_image, pil_image, output_path, preview, level_background, level_method, level_intensity, auto_rotate)
+    
+    def _crop_and_save(self, cv_image, pil_image, output_path, preview, level_background, level_method, level_intensity, auto_rotate):
+        """Rotate, level, crop and optionally save a loaded image. Shared by resize_image and resize_array."""
         # Auto-rotate image if needed
         if auto_rotate:
             cv_image, rotation_applied = self.rotate_image_if_needed(cv_image, auto_rotate=True)
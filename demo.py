@@ -5,14 +5,19 @@ Demo script for the Check Resizer Tool
 This script creates sample check images and demonstrates the tool's capabilities.
 """
 
+import cv2
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 import os
 from pathlib import Path
 from check_resizer import CheckResizer
 
 
-def create_sample_check(filename, check_size=(600, 250), canvas_size=(800, 600), noise_level=0.1):
-    """Create a realistic sample check image with whitespace."""
+def create_sample_check(filename=None, check_size=(600, 250), canvas_size=(800, 600), noise_level=0.1):
+    """Create a realistic sample check image with whitespace.
+    
+    Returns the image as a BGR array; it is also saved if filename is given.
+    """
     
     # Create canvas with whitespace
     canvas = Image.new('RGB', canvas_size, 'white')
@@ -75,8 +80,11 @@ def create_sample_check(filename, check_size=(600, 250), canvas_size=(800, 600),
             y = random.randint(0, canvas_size[1] - 1)
             draw.point((x, y), fill=(200, 200, 200))
     
-    canvas.save(filename)
-    print(f"Created sample check: {filename}")
+    if filename is not None:
+        canvas.save(filename)
+        print(f"Created sample check: {filename}")
+    
+    return cv2.cvtColor(np.asarray(canvas), cv2.COLOR_RGB2BGR)
 
 
 def run_demo():
@@ -14,8 +14,29 @@ from pathlib import Path
 from check_batch_processor import CheckBatchProcessor
 import random
 
-def create_sample_check(check_type: str, filename: str, dpi: int = 300) -> str:
-    """Create a sample check image for testing."""
+def _rotate_expanded(image: np.ndarray, angle: float) -> np.ndarray:
+    """Rotate an image counterclockwise by angle degrees, expanding the canvas to fit."""
+    height, width = image.shape[:2]
+    
+    matrix = cv2.getRotationMatrix2D(((width - 1) / 2, (height - 1) / 2), angle, 1.0)
+    cos, sin = abs(matrix[0, 0]), abs(matrix[0, 1])
+    new_width = int(round(height * sin + width * cos))
+    new_height = int(round(height * cos + width * sin))
+    
+    # Shift so the rotated image is centered in the expanded canvas
+    matrix[0, 2] += (new_width - width) / 2
+    matrix[1, 2] += (new_height - height) / 2
+    
+    return cv2.warpAffine(
+        image, matrix, (new_width, new_height),
+        flags=cv2.INTER_LINEAR, borderValue=(255, 255, 255)
+    )
+
+def create_sample_check(check_type: str, filename: str, dpi: int = 300, upright: bool = False) -> str:
+    """Create a sample check image for testing.
+    
+    With upright=True the random 90-degree turns are skipped; the slight skew is kept.
+    """
     
     # Define check dimensions (in pixels at given DPI)
     dimensions = {
@@ -141,25 +162,30 @@ def create_sample_check(check_type: str, filename: str, dpi: int = 300) -> str:
     
     # Add some realistic imperfections
     # Slight rotation
+    angle = 0.0
     if random.random() > 0.3:  # Increased chance of rotation for demo
         angle = random.uniform(-15, 15)  # Larger rotation range
-        image = image.rotate(angle, expand=True, fillcolor='white')
-    
-    # Add some margin/padding to simulate scanning
-    padding = int(0.3 * dpi)  # 0.3" padding
-    padded_width = image.width + 2 * padding
-    padded_height = image.height + 2 * padding
-    
-    padded_image = Image.new('RGB', (padded_width, padded_height), color='lightgray')
-    paste_x = (padded_width - image.width) // 2
-    paste_y = (padded_height - image.height) // 2
-    padded_image.paste(image, (paste_x, paste_y))
     
     # Randomly apply 90-degree rotations to simulate phone photos
-    if random.random() > 0.7:  # 30% chance
+    rotation_steps = 0
+    if random.random() > 0.7 and not upright:  # 30% chance
         rotation_steps = random.choice([1, 2, 3])  # 90, 180, or 270 degrees
-        for _ in range(rotation_steps):
-            padded_image = padded_image.rotate(90, expand=True)
+    
+    # Apply the skew and the 90-degree steps as one combined rotation. The
+    # padding below is uniform on every side, so rotating before padding gives
+    # the same result as rotating the padded image.
+    image_array = np.asarray(image)
+    total_angle = angle + 90 * rotation_steps
+    if total_angle % 360:
+        image_array = _rotate_expanded(image_array, total_angle)
+    
+    # Add some margin/padding to simulate scanning
+    padding = int(0.3 * dpi)  # 0.3" padding
+    image_array = cv2.copyMakeBorder(
+        image_array, padding, padding, padding, padding,
+        cv2.BORDER_CONSTANT, value=(211, 211, 211)  # lightgray
+    )
+    padded_image = Image.fromarray(image_array)
     
     # Save image
     padded_image.save(filename, 'PNG', dpi=(dpi, dpi))
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the test scripts
+On-disk cache for generated test check images, so sample checks are not
+re-rendered on every run
+"""
+
+import contextlib
+import cv2
+import functools
+import hashlib
+import numpy as np
+import os
+import random
+import shutil
+from pathlib import Path
+from check_batch_processor import CACHE_ROOT
+from demo_batch import create_sample_check
+
+# Bump when the image generators change so stale fixtures are not reused
+FIXTURE_VERSION = 4
+
+FIXTURE_CACHE_DIR = CACHE_ROOT / "fixtures"
+
+def _cache_path(name: str, args: tuple, kwargs: dict) -> Path:
+    """Return the cache file for a generator call."""
+    key = hashlib.sha1(repr((FIXTURE_VERSION, name, args, sorted(kwargs.items()))).encode()).hexdigest()
+    return FIXTURE_CACHE_DIR / f"{key}.png"
+
+@contextlib.contextmanager
+def _seeded_random(path: Path):
+    """Seed random and np.random from a cache file's key while rendering it.
+
+    The generators draw skew, rotation and check numbers at random; seeding
+    from the key makes each cached fixture the same whenever it is rebuilt.
+    The previous generator states are restored afterwards.
+    """
+    key = path.stem
+    random_state, np_state = random.getstate(), np.random.get_state()
+    random.seed(key)
+    np.random.seed(int(key[:8], 16))
+    try:
+        yield
+    finally:
+        random.setstate(random_state)
+        np.random.set_state(np_state)
+
+def _temp_path(path: Path) -> Path:
+    """Return a per-process scratch path next to path, for atomic writes."""
+    return path.with_name(f"{path.stem}.{os.getpid()}.tmp.png")
+
+def fixture_cache(func):
+    """Cache the BGR image returned by an image generator as a PNG file."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        path = _cache_path(func.__name__, args, kwargs)
+        if path.exists():
+            image = cv2.imread(str(path))
+            if image is not None:
+                return image
+
+        with _seeded_random(path):
+            image = func(*args, **kwargs)
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = _temp_path(path)
+        if cv2.imwrite(str(temp_path), image):
+            os.replace(temp_path, path)
+        return image
+
+    return wrapper
+
+def cached_sample_check(check_type: str, filename: str, dpi: int = 300, upright: bool = False) -> str:
+    """Write a sample check to filename, reusing a cached render when available.
+
+    With upright=True the check is only skewed, never turned by 90 degree steps.
+    """
+    path = _cache_path("create_sample_check", (check_type, dpi), {'upright': upright})
+
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = _temp_path(path)
+        with _seeded_random(path):
+            create_sample_check(check_type, str(temp_path), dpi=dpi, upright=upright)
+        os.replace(temp_path, path)
+
+    shutil.copyfile(path, filename)
+    return filename
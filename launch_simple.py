@@ -10,6 +10,7 @@ from pathlib import Path
 import webbrowser
 import time
 import threading
+import urllib.request
 
 def get_bundled_dir():
     """Get the directory containing bundled files."""
@@ -20,11 +21,54 @@ def get_bundled_dir():
         # Running as script
         return Path(__file__).parent
 
+def wait_for_server(url='http://localhost:8501/_stcore/health', timeout=30):
+    """Poll Streamlit's health endpoint until it reports ok. Returns True if it did."""
+    # The server is local, so bypass any http_proxy from the environment
+    opener = urllib.request.build_opener(urllib.request.ProxyHandler({}))
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with opener.open(url, timeout=0.2) as response:
+                if response.read() == b'ok':
+                    return True
+        except OSError:  # URLError, refused connections and timeouts
+            pass
+        time.sleep(0.1)
+    return False
+
+def open_browser(url, timeout=2.0):
+    """Ask the default browser to open url, waiting at most timeout seconds.
+    
+    Some webbrowser backends block until the browser exits, so the call runs
+    on its own daemon thread. Returns False if it has not finished in time;
+    the browser has usually been told to open by then anyway. Errors raised
+    by the browser backend are re-raised here.
+    """
+    errors = []
+    
+    def run():
+        try:
+            webbrowser.get().open_new_tab(url)
+        except Exception as e:
+            errors.append(e)
+    
+    opener = threading.Thread(target=run, daemon=True)
+    opener.start()
+    opener.join(timeout)
+    
+    if errors:
+        raise errors[0]
+    return not opener.is_alive()
+
 def open_browser_delayed():
-    """Open browser after a delay."""
-    time.sleep(3)
+    """Open browser once the Streamlit app is ready."""
+    if not wait_for_server():
+        print("⚠️  Web UI did not report ready within 30 seconds; not opening the browser")
+        print("   Please manually open: http://localhost:8501")
+        return
     try:
-        webbrowser.open('http://localhost:8501')
+        if not open_browser('http://localhost:8501'):
+            print("⚠️  Browser launcher is still running; continuing without waiting for it")
         print("🌐 Browser should now open to http://localhost:8501")
     except Exception as e:
         print(f"⚠️  Could not open browser automatically: {e}")
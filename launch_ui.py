@@ -3,7 +3,6 @@
 Quick launcher for the Check Resizer Web UI
 """
 
-import subprocess
 import sys
 import os
 from pathlib import Path
@@ -18,23 +17,13 @@ def main():
     script_dir = Path(__file__).parent
     ui_script = script_dir / "ui.py"
     
-    # Check if virtual environment is activated
-    venv_python = script_dir / ".venv" / "bin" / "python"
-    
-    if venv_python.exists():
-        python_cmd = str(venv_python)
-        print("✅ Using virtual environment")
-    else:
-        python_cmd = sys.executable
-        print("⚠️  Using system Python (virtual environment not found)")
-    
     # Check if ui.py exists
     if not ui_script.exists():
         print(f"❌ UI script not found: {ui_script}")
         sys.exit(1)
     
     print(f"📁 Working directory: {script_dir}")
-    print(f"🐍 Python executable: {python_cmd}")
+    print(f"🐍 Python executable: {sys.executable}")
     print(f"🌐 Starting web interface...")
     print()
     print("💡 The web interface will open in your default browser")
@@ -45,9 +34,11 @@ def main():
         # Change to the script directory
         os.chdir(script_dir)
         
-        # Launch streamlit
-        cmd = [python_cmd, "-m", "streamlit", "run", "ui.py"]
-        subprocess.run(cmd)
+        # Run Streamlit in this process instead of spawning a new interpreter
+        import streamlit.web.cli as stcli
+        
+        sys.argv = ["streamlit", "run", str(ui_script)]
+        sys.exit(stcli.main())
         
     except KeyboardInterrupt:
         print("\n👋 Shutting down Check Resizer Web UI...")
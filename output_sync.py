@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Output syncing for the test scripts
+Copies a finished test's scratch directory to a permanent folder for
+inspection, hard-linking files instead of copying them where possible
+"""
+
+import os
+import shutil
+
+def mirror_directory(src: str, dst: str) -> None:
+    """Make dst hold the same files as src, hard-linking instead of copying.
+
+    Files already in dst that are at least as new as their source are left
+    alone, and files no longer in src are removed. Falls back to copying
+    when src and dst are on different filesystems.
+    """
+    os.makedirs(dst, exist_ok=True)
+
+    src_names = set()
+    for entry in os.scandir(src):
+        if not entry.is_file():
+            continue
+        src_names.add(entry.name)
+
+        target = os.path.join(dst, entry.name)
+        if os.path.exists(target) and entry.stat().st_mtime <= os.stat(target).st_mtime:
+            continue
+
+        temp_target = f"{target}.{os.getpid()}.tmp"
+        try:
+            os.link(entry.path, temp_target)
+        except OSError:
+            shutil.copy2(entry.path, temp_target)
+        os.replace(temp_target, target)
+
+    for entry in os.scandir(dst):
+        if entry.is_file() and entry.name not in src_names:
+            os.remove(entry.path)
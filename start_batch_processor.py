@@ -4,7 +4,7 @@ Launcher for Check Batch Processor UI
 Starts Streamlit application for batch processing checks
 """
 
-import subprocess
+import importlib.util
 import sys
 import os
 from pathlib import Path
@@ -24,17 +24,14 @@ def main():
         print(f"❌ Error: {batch_ui_path} not found!")
         return 1
     
-    # Check if required dependencies are available
-    try:
-        import streamlit
-        import reportlab
-        import sklearn
-        print("✅ Dependencies verified")
-    except ImportError as e:
-        print(f"❌ Missing dependency: {e}")
-        print("\nPlease install required packages:")
-        print("pip install streamlit reportlab scikit-learn")
-        return 1
+    # Check if required dependencies are available (without importing them)
+    for module_name in ("streamlit", "reportlab", "sklearn"):
+        if importlib.util.find_spec(module_name) is None:
+            print(f"❌ Missing dependency: {module_name}")
+            print("\nPlease install required packages:")
+            print("pip install streamlit reportlab scikit-learn")
+            return 1
+    print("✅ Dependencies verified")
     
     # Launch Streamlit
     try:
@@ -45,16 +42,18 @@ def main():
         print("🛑 Press Ctrl+C to stop the server")
         print("=" * 50)
         
-        # Run Streamlit
-        cmd = [
-            sys.executable, "-m", "streamlit", "run", 
+        # Run Streamlit in this process instead of spawning a new interpreter
+        import streamlit.web.cli as stcli
+        
+        sys.argv = [
+            "streamlit", "run",
             str(batch_ui_path),
             "--server.port", "8502",  # Use different port than main UI
             "--server.headless", "false",
             "--browser.gatherUsageStats", "false"
         ]
         
-        subprocess.run(cmd)
+        sys.exit(stcli.main())
         
     except KeyboardInterrupt:
         print("\n🛑 Shutting down...")
@@ -3,41 +3,48 @@
 Test script to verify the check resizer tool installation and functionality.
 """
 
+import argparse
+import importlib
+import importlib.util
 import sys
 import os
-from pathlib import Path
 
-def test_imports():
-    """Test if all required packages can be imported."""
-    print("Testing package imports...")
-    
-    try:
-        import cv2
-        print("✓ OpenCV imported successfully")
-    except ImportError as e:
-        print(f"✗ OpenCV import failed: {e}")
-        return False
-    
-    try:
-        import numpy as np
-        print("✓ NumPy imported successfully")
-    except ImportError as e:
-        print(f"✗ NumPy import failed: {e}")
-        return False
+# (module to import, package name) for each required dependency
+REQUIRED_PACKAGES = [
+    ("cv2", "OpenCV"),
+    ("numpy", "NumPy"),
+    ("PIL.Image", "Pillow"),
+]
+
+# Only needed for the --preview plots, so checked on request
+MATPLOTLIB_PACKAGE = ("matplotlib.pyplot", "Matplotlib")
+
+def test_imports(deep=False, matplotlib=False):
+    """Test if all required packages are installed.
     
-    try:
-        from PIL import Image
-        print("✓ Pillow imported successfully")
-    except ImportError as e:
-        print(f"✗ Pillow import failed: {e}")
-        return False
+    By default each package is only located on sys.path, which is fast and
+    does not run the package's own imports. Pass deep=True to import them,
+    and matplotlib=True to also check the optional preview dependency.
+    """
+    print("Testing package imports...")
     
-    try:
-        import matplotlib.pyplot as plt
-        print("✓ Matplotlib imported successfully")
-    except ImportError as e:
-        print(f"✗ Matplotlib import failed: {e}")
-        return False
+    packages = REQUIRED_PACKAGES + ([MATPLOTLIB_PACKAGE] if matplotlib else [])
+    for module_name, package_name in packages:
+        top_level = module_name.partition(".")[0]
+        if importlib.util.find_spec(top_level) is None:
+            print(f"✗ {package_name} not found")
+            return False
+        
+        if not deep:
+            print(f"✓ {package_name} found")
+            continue
+        
+        try:
+            importlib.import_module(module_name)
+            print(f"✓ {package_name} imported successfully")
+        except ImportError as e:
+            print(f"✗ {package_name} import failed: {e}")
+            return False
     
     return True
 
@@ -63,8 +70,8 @@ def create_test_image():
     print("\nCreating test image...")
     
     try:
+        # Imported here so a missing Pillow is reported, not raised at startup
         from PIL import Image, ImageDraw
-        import numpy as np
         
         # Create a white image with a black rectangle (simulating a check)
         width, height = 800, 600
@@ -136,15 +143,28 @@ def test_processing(test_image_path):
 
 def main():
     """Run all tests."""
+    parser = argparse.ArgumentParser(description="Verify the check resizer tool installation")
+    parser.add_argument("--deep", action="store_true",
+                       help="Import each required package instead of only locating it")
+    parser.add_argument("--imports", action="store_true",
+                       help="Only check that the required packages are installed")
+    parser.add_argument("--matplotlib", action="store_true",
+                       help="Also check Matplotlib, which is only needed for --preview")
+    args = parser.parse_args()
+    
     print("Check Resizer Tool - Installation Test")
     print("=" * 40)
     
     # Test imports
-    if not test_imports():
+    if not test_imports(deep=args.deep, matplotlib=args.matplotlib):
         print("\n❌ Import test failed. Please install required packages:")
         print("pip install -r requirements.txt")
         sys.exit(1)
     
+    if args.imports:
+        print("\n🎉 All required packages are installed.")
+        return
+    
     # Test CheckResizer class
     if not test_check_resizer():
         print("\n❌ CheckResizer class test failed.")
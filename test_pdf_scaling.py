@@ -2,9 +2,30 @@
 
 import cv2
 import numpy as np
-from PIL import Image
 import os
-from check_batch_processor import CheckBatchProcessor
+from batch_harness import processed_batch, start_pool
+
+def _rasterize_label(text):
+    """Render a ruler label once; returns its coverage (0-1) and offset from the putText origin."""
+    (text_width, text_height), baseline = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 2)
+    pad = 4
+    canvas = np.zeros((text_height + baseline + 2 * pad, text_width + 2 * pad), dtype=np.uint8)
+    origin = (pad, pad + text_height)
+    cv2.putText(canvas, text, origin, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 255, 2)
+    
+    ys, xs = np.nonzero(canvas)
+    coverage = canvas[ys.min():ys.max()+1, xs.min():xs.max()+1, None] / 255.0
+    return coverage, xs.min() - origin[0], ys.min() - origin[1]
+
+# Inch labels are a fixed set, so render them once and blit them per tick
+_RULER_LABELS = {f"{inch}\"": _rasterize_label(f"{inch}\"") for inch in range(1, 6)}
+
+def _draw_ruler_label(image, text, origin, color):
+    """Blend a pre-rendered ruler label into image, placed like cv2.putText at origin."""
+    coverage, dx, dy = _RULER_LABELS[text]
+    x, y = origin[0] + dx, origin[1] + dy
+    region = image[y:y+coverage.shape[0], x:x+coverage.shape[1]]
+    region[:] = np.rint(region * (1 - coverage) + np.array(color) * coverage)
 
 def create_test_check_with_ruler():
     """Create a test check with ruler markings to verify scaling."""
@@ -16,23 +37,23 @@ def create_test_check_with_ruler():
     print(f"Creating test check: {width_pixels}x{height_pixels} pixels (6\" x 2.75\" at 300 DPI)")
     
     # Create white background
-    image = np.ones((height_pixels, width_pixels, 3), dtype=np.uint8) * 255
+    image = np.full((height_pixels, width_pixels, 3), 255, dtype=np.uint8)
     
     # Add border
     cv2.rectangle(image, (20, 20), (width_pixels-20, height_pixels-20), (0, 0, 0), 3)
     
-    # Add ruler markings along top (inches)
-    for inch in range(1, 6):
-        x = inch * 300  # 300 pixels per inch
-        cv2.line(image, (x, 20), (x, 60), (255, 0, 0), 2)
-        cv2.putText(image, f"{inch}\"", (x-15, 55), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 0, 0), 2)
+    # Add ruler markings along top (inches), drawn as 3-pixel-wide column slices
+    tick_xs = np.arange(1, 6) * 300  # 300 pixels per inch
+    image[20:61, (tick_xs[:, None] + np.arange(-1, 2)).ravel()] = (255, 0, 0)
+    for inch, x in enumerate(tick_xs, start=1):
+        _draw_ruler_label(image, f"{inch}\"", (int(x)-15, 55), (255, 0, 0))
     
     # Add ruler markings along left side (inches)  
-    for inch in range(1, 3):
-        y = inch * 300  # 300 pixels per inch
-        if y < height_pixels - 20:
-            cv2.line(image, (20, y), (80, y), (255, 0, 0), 2)
-            cv2.putText(image, f"{inch}\"", (85, y+5), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 0, 0), 2)
+    tick_ys = np.arange(1, 3) * 300  # 300 pixels per inch
+    tick_ys = tick_ys[tick_ys < height_pixels - 20]
+    image[(tick_ys[:, None] + np.arange(-1, 2)).ravel(), 20:81] = (255, 0, 0)
+    for inch, y in enumerate(tick_ys, start=1):
+        _draw_ruler_label(image, f"{inch}\"", (85, int(y)+5), (255, 0, 0))
     
     # Add check content
     cv2.putText(image, "SCALE TEST CHECK", (100, 120), cv2.FONT_HERSHEY_SIMPLEX, 1.2, (0, 0, 0), 2)
@@ -55,63 +76,56 @@ def test_pdf_scaling():
     print("📏 Testing PDF Scaling with Ruler Measurements")
     print("=" * 55)
     
+    start_pool()
+    
     # Create test check with ruler
     test_image = create_test_check_with_ruler()
     
-    # Save test check in different orientations
+    # Prepare test check in different orientations (kept in memory)
     test_dir = "./scale_test_output"
-    os.makedirs(test_dir, exist_ok=True)
     
-    test_files = []
+    test_images = []
     
     # Horizontal orientation (correct)
-    horizontal_path = os.path.join(test_dir, "scale_test_horizontal.png") 
-    cv2.imwrite(horizontal_path, test_image)
-    test_files.append(horizontal_path)
-    print(f"✅ Saved horizontal: {test_image.shape[1]}x{test_image.shape[0]}")
+    test_images.append(("scale_test_horizontal.png", test_image))
+    print(f"✅ Prepared horizontal: {test_image.shape[1]}x{test_image.shape[0]}")
     
     # Vertical orientation (needs rotation)
     vertical_image = cv2.rotate(test_image, cv2.ROTATE_90_CLOCKWISE)
-    vertical_path = os.path.join(test_dir, "scale_test_vertical.png")
-    cv2.imwrite(vertical_path, vertical_image) 
-    test_files.append(vertical_path)
-    print(f"✅ Saved vertical: {vertical_image.shape[1]}x{vertical_image.shape[0]}")
+    test_images.append(("scale_test_vertical.png", vertical_image))
+    print(f"✅ Prepared vertical: {vertical_image.shape[1]}x{vertical_image.shape[0]}")
     
     # Process with batch processor
     print(f"\n🔄 Processing scale test checks...")
-    processor = CheckBatchProcessor()
-    processor.auto_rotate = True
-    processor.level_background = False  # Don't modify for scale test
-    
-    results = processor.process_batch(test_files, test_dir)
-    
-    # Show results
-    print(f"\n📊 Scale Test Results:")
-    for i, check_info in enumerate(results['processed_checks']):
-        classification = check_info['classification']
-        original_name = os.path.basename(check_info['original_path'])
-        print(f"   {i+1}. {original_name}")
-        print(f"      Type: {classification['type']} ({classification['confidence']:.1%})")
-        print(f"      Measured: {classification['dimensions']['width_inches']:.2f}\" x {classification['dimensions']['height_inches']:.2f}\"")
-        print(f"      Expected: 6.00\" x 2.75\"")
-        print(f"      Scale accuracy: {abs(classification['dimensions']['width_inches'] - 6.0)/6.0*100:.1f}% width error, {abs(classification['dimensions']['height_inches'] - 2.75)/2.75*100:.1f}% height error")
-    
-    # Show PDF info
-    print(f"\n📄 Generated PDF:")
-    for pdf_info in results['pdf_files']:
-        file_size = os.path.getsize(pdf_info['path']) / 1024
-        print(f"   {pdf_info['type'].title()}: {os.path.basename(pdf_info['path'])} ({file_size:.1f} KB)")
-        print(f"   📏 This PDF should show checks at exactly 6\" x 2.75\" when printed")
+    # No background leveling, so the scale test images are not modified
+    with processed_batch(test_images, test_dir, level_background=False) as results:
+        # Show results
+        print(f"\n📊 Scale Test Results:")
+        for i, check_info in enumerate(results['processed_checks']):
+            classification = check_info['classification']
+            original_name = os.path.basename(check_info['original_path'])
+            print(f"   {i+1}. {original_name}")
+            print(f"      Type: {classification['type']} ({classification['confidence']:.1%})")
+            print(f"      Measured: {classification['dimensions']['width_inches']:.2f}\" x {classification['dimensions']['height_inches']:.2f}\"")
+            print(f"      Expected: 6.00\" x 2.75\"")
+            print(f"      Scale accuracy: {abs(classification['dimensions']['width_inches'] - 6.0)/6.0*100:.1f}% width error, {abs(classification['dimensions']['height_inches'] - 2.75)/2.75*100:.1f}% height error")
+    
+        # Show PDF info
+        print(f"\n📄 Generated PDF:")
+        for pdf_info in results['pdf_files']:
+            file_size = os.path.getsize(pdf_info['path']) / 1024
+            print(f"   {pdf_info['type'].title()}: {os.path.basename(pdf_info['path'])} ({file_size:.1f} KB)")
+            print(f"   📏 This PDF should show checks at exactly 6\" x 2.75\" when printed")
         
-    print(f"\n🎯 Scale Verification Instructions:")
-    print(f"   1. Open the generated PDF")
-    print(f"   2. Print at 100% scale (no scaling)")  
-    print(f"   3. Measure the printed checks with a ruler")
-    print(f"   4. They should be exactly 6\" wide x 2.75\" tall")
-    print(f"   5. The ruler markings in the image should align with actual measurements")
-    
-    print(f"\n✅ Scale test complete!")
-    print(f"📁 Files saved to: {test_dir}")
+        print(f"\n🎯 Scale Verification Instructions:")
+        print(f"   1. Open the generated PDF")
+        print(f"   2. Print at 100% scale (no scaling)")  
+        print(f"   3. Measure the printed checks with a ruler")
+        print(f"   4. They should be exactly 6\" wide x 2.75\" tall")
+        print(f"   5. The ruler markings in the image should align with actual measurements")
+    
+        print(f"\n✅ Scale test complete!")
+        print(f"📁 Files saved to: {test_dir}")
 
 if __name__ == "__main__":
     test_pdf_scaling()
\ No newline at end of file
@@ -6,12 +6,75 @@ Creates rotated images and tests the auto-rotation detection
 
 import cv2
 import numpy as np
-from PIL import Image
 import os
+import struct
+import sys
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from check_resizer import CheckResizer
-from demo_batch import create_sample_check
+from fixture_cache import cached_sample_check
+from output_sync import mirror_directory
+
+def _png_shape(path):
+    """Return (height, width) of a PNG from its IHDR header, without decoding pixels."""
+    with open(path, 'rb') as f:
+        header = f.read(24)
+    width, height = struct.unpack('>II', header[16:24])
+    return height, width
+
+def _fast_write_png(path, image, compression=1):
+    """Write a test artifact PNG with light compression in a single buffered write."""
+    ok, buffer = cv2.imencode('.png', image, [cv2.IMWRITE_PNG_COMPRESSION, compression])
+    if not ok:
+        raise ValueError(f"Could not encode PNG: {path}")
+    with open(path, 'wb', buffering=1 << 20) as f:
+        f.write(buffer)
+
+def _test_single_angle(angle, base_image, temp_path):
+    """Rotate the base check by angle, then detect and correct it.
+    
+    Returns (angle, result, log): progress lines are collected rather than
+    printed so the parent can show each angle's output in one piece.
+    """
+    resizer = CheckResizer()
+    
+    # The rotated views share this buffer, so fail loudly if anything writes to it
+    base_image.setflags(write=False)
+    
+    log = [f"\n🔄 Testing {angle}° rotation..."]
+    
+    # Create rotated version as a view (negative k turns clockwise, like cv2.rotate)
+    rotated_image = np.rot90(base_image, k=-(angle // 90))
+    
+    rot_height, rot_width = rotated_image.shape[:2]
+    log.append(f"   Rotated size: {rot_width} x {rot_height} pixels")
+    
+    # Test orientation detection
+    detected_rotation = resizer.detect_orientation(rotated_image)
+    log.append(f"   Detected rotation needed: {detected_rotation}°")
+    
+    # Test auto-correction
+    corrected_image, applied_rotation = resizer.rotate_image_if_needed(rotated_image, auto_rotate=True)
+    corr_height, corr_width = corrected_image.shape[:2]
+    log.append(f"   Applied rotation: {applied_rotation}°")
+    log.append(f"   Corrected size: {corr_width} x {corr_height} pixels")
+    
+    # Save rotated and corrected images once detection is done
+    rotated_filename = temp_path / f"test_check_{angle}deg.png"
+    _fast_write_png(rotated_filename, rotated_image)
+    
+    corrected_filename = temp_path / f"test_check_{angle}deg_corrected.png"
+    _fast_write_png(corrected_filename, corrected_image)
+    
+    # Success is scored for all angles together once the sweep is done
+    return angle, {
+        'detected_rotation': detected_rotation,
+        'applied_rotation': applied_rotation,
+        'original_size': (rot_width, rot_height),
+        'corrected_size': (corr_width, corr_height)
+    }, log
 
 def test_rotation_detection():
     """Test the rotation detection and correction functionality."""
@@ -22,10 +85,11 @@ def test_rotation_detection():
     resizer = CheckResizer()
     
     with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
         
         # Create a sample check image
-        base_filename = os.path.join(temp_dir, "test_check_base.png")
-        create_sample_check('personal', base_filename, dpi=300)
+        base_filename = str(temp_path / "test_check_base.png")
+        cached_sample_check('personal', base_filename, dpi=300, upright=True)
         
         # Load the base image
         base_image = cv2.imread(base_filename)
@@ -38,56 +102,26 @@ def test_rotation_detection():
         test_angles = [0, 90, 180, 270]
         results = {}
         
-        for angle in test_angles:
-            print(f"\n🔄 Testing {angle}° rotation...")
-            
-            # Create rotated version
-            if angle == 0:
-                rotated_image = base_image.copy()
-            elif angle == 90:
-                rotated_image = cv2.rotate(base_image, cv2.ROTATE_90_CLOCKWISE)
-            elif angle == 180:
-                rotated_image = cv2.rotate(base_image, cv2.ROTATE_180)
-            elif angle == 270:
-                rotated_image = cv2.rotate(base_image, cv2.ROTATE_90_COUNTERCLOCKWISE)
-            
-            # Save rotated image
-            rotated_filename = os.path.join(temp_dir, f"test_check_{angle}deg.png")
-            cv2.imwrite(rotated_filename, rotated_image)
-            
-            rot_height, rot_width = rotated_image.shape[:2]
-            print(f"   Rotated size: {rot_width} x {rot_height} pixels")
-            
-            # Test orientation detection
-            detected_rotation = resizer.detect_orientation(rotated_image)
-            print(f"   Detected rotation needed: {detected_rotation}°")
-            
-            # Test auto-correction
-            corrected_image, applied_rotation = resizer.rotate_image_if_needed(rotated_image, auto_rotate=True)
-            corr_height, corr_width = corrected_image.shape[:2]
-            print(f"   Applied rotation: {applied_rotation}°")
-            print(f"   Corrected size: {corr_width} x {corr_height} pixels")
-            
-            # Save corrected image
-            corrected_filename = os.path.join(temp_dir, f"test_check_{angle}deg_corrected.png")
-            cv2.imwrite(corrected_filename, corrected_image)
-            
-            # Calculate if correction was successful
-            original_aspect = width / height
-            corrected_aspect = corr_width / corr_height
-            aspect_similarity = abs(original_aspect - corrected_aspect) / original_aspect
-            
-            success = aspect_similarity < 0.1  # Within 10% of original aspect ratio
-            print(f"   Success: {'✅' if success else '❌'} (aspect ratio similarity: {(1-aspect_similarity)*100:.1f}%)")
-            
-            results[angle] = {
-                'detected_rotation': detected_rotation,
-                'applied_rotation': applied_rotation,
-                'success': success,
-                'aspect_similarity': 1 - aspect_similarity,
-                'original_size': (rot_width, rot_height),
-                'corrected_size': (corr_width, corr_height)
-            }
+        # Each angle is independent, so sweep them on separate processes.
+        # The base image is decoded once here and pickled to each worker,
+        # which costs a memory copy rather than another PNG decode.
+        with ProcessPoolExecutor(max_workers=min(4, os.cpu_count() or 1)) as pool:
+            for angle, result, log in pool.map(_test_single_angle, test_angles,
+                                               repeat(base_image), repeat(temp_path)):
+                results[angle] = result
+                sys.stdout.write('\n'.join(log) + '\n')
+                sys.stdout.flush()
+        
+        # Correction succeeded if the corrected aspect ratio is within 10% of the original
+        sizes = np.array([r['original_size'] + r['corrected_size'] for r in results.values()], dtype=np.float64)
+        original_aspect = width / height
+        corrected_aspect = sizes[:, 2] / sizes[:, 3]
+        aspect_similarity = np.abs(original_aspect - corrected_aspect) / original_aspect
+        success = aspect_similarity < 0.1
+        
+        for result, similarity, passed in zip(results.values(), aspect_similarity, success):
+            result['success'] = bool(passed)
+            result['aspect_similarity'] = 1 - float(similarity)
         
         # Summary
         print(f"\n📊 Auto-Rotation Test Results:")
@@ -112,62 +146,61 @@ def test_rotation_detection():
             print("Check the individual results above for details.")
         
         # Test with actual processing pipeline
-        print(f"\n🔧 Testing Full Processing Pipeline...")
-        
-        # Test processing a rotated image
-        rotated_90_file = os.path.join(temp_dir, "test_check_90deg.png")
-        output_file = os.path.join(temp_dir, "processed_output.png")
-        
-        # Process with auto-rotation enabled
-        success_with_rotation = resizer.resize_image(
-            rotated_90_file, 
-            output_file, 
-            preview=False,
-            auto_rotate=True
-        )
-        
-        # Process with auto-rotation disabled
-        output_file_no_rotation = os.path.join(temp_dir, "processed_output_no_rotation.png")
-        success_without_rotation = resizer.resize_image(
-            rotated_90_file,
-            output_file_no_rotation, 
-            preview=False,
-            auto_rotate=False
-        )
-        
-        print(f"  Processing with auto-rotation: {'✅ Success' if success_with_rotation else '❌ Failed'}")
-        print(f"  Processing without auto-rotation: {'✅ Success' if success_without_rotation else '❌ Failed'}")
-        
-        if success_with_rotation and success_without_rotation:
-            # Compare output sizes
-            if os.path.exists(output_file):
-                rotated_result = cv2.imread(output_file)
-                rr_height, rr_width = rotated_result.shape[:2]
-                rotated_aspect = rr_width / rr_height
-            else:
-                rotated_aspect = 0
+        # (only meaningful if the 90° check was detected and corrected above)
+        if results[90]['success']:
+            print(f"\n🔧 Testing Full Processing Pipeline...")
+            
+            # Test processing a rotated image
+            rotated_90_file = str(temp_path / "test_check_90deg.png")
+            output_file = str(temp_path / "processed_output.png")
+            
+            # Process with auto-rotation enabled
+            success_with_rotation = resizer.resize_image(
+                rotated_90_file, 
+                output_file, 
+                preview=False,
+                auto_rotate=True
+            )
+            
+            # Process with auto-rotation disabled
+            output_file_no_rotation = str(temp_path / "processed_output_no_rotation.png")
+            success_without_rotation = resizer.resize_image(
+                rotated_90_file,
+                output_file_no_rotation, 
+                preview=False,
+                auto_rotate=False
+            )
+            
+            print(f"  Processing with auto-rotation: {'✅ Success' if success_with_rotation else '❌ Failed'}")
+            print(f"  Processing without auto-rotation: {'✅ Success' if success_without_rotation else '❌ Failed'}")
+            
+            if success_with_rotation and success_without_rotation:
+                # Compare output sizes
+                if os.path.exists(output_file):
+                    rr_height, rr_width = _png_shape(output_file)
+                    rotated_aspect = rr_width / rr_height
+                else:
+                    rotated_aspect = 0
                 
-            if os.path.exists(output_file_no_rotation):
-                no_rotation_result = cv2.imread(output_file_no_rotation)
-                nr_height, nr_width = no_rotation_result.shape[:2]
-                no_rotation_aspect = nr_width / nr_height
-            else:
-                no_rotation_aspect = 0
+                if os.path.exists(output_file_no_rotation):
+                    nr_height, nr_width = _png_shape(output_file_no_rotation)
+                    no_rotation_aspect = nr_width / nr_height
+                else:
+                    no_rotation_aspect = 0
+            
+                print(f"  With auto-rotation aspect ratio: {rotated_aspect:.2f}")
+                print(f"  Without auto-rotation aspect ratio: {no_rotation_aspect:.2f}")
             
-            print(f"  With auto-rotation aspect ratio: {rotated_aspect:.2f}")
-            print(f"  Without auto-rotation aspect ratio: {no_rotation_aspect:.2f}")
+                # Check if auto-rotation produced a more horizontal result
+                more_horizontal = rotated_aspect > no_rotation_aspect
+                print(f"  Auto-rotation made image more horizontal: {'✅ Yes' if more_horizontal else '❌ No'}")
             
-            # Check if auto-rotation produced a more horizontal result
-            more_horizontal = rotated_aspect > no_rotation_aspect
-            print(f"  Auto-rotation made image more horizontal: {'✅ Yes' if more_horizontal else '❌ No'}")
+        else:
+            print(f"\n⏭️  Skipping pipeline test: 90° rotation detection failed")
         
         # Save test files to permanent location for inspection
         test_output = "./test_rotation_output"
-        if os.path.exists(test_output):
-            shutil.rmtree(test_output)
-        
-        import shutil
-        shutil.copytree(temp_dir, test_output)
+        mirror_directory(temp_dir, test_output)
         print(f"\n💾 Test files saved to: {test_output}")
         
         return successful_tests == total_tests
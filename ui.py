@@ -10,13 +10,16 @@ import cv2
 import numpy as np
 from PIL import Image
 import io
-import base64
+import hashlib
 from pathlib import Path
 import time
 import sys
-from contextlib import redirect_stdout
+from collections import deque
 from check_resizer import CheckResizer
 
+# Uploads with these extensions are downloaded as JPEG, everything else as PNG
+_JPEG_EXTS = frozenset({'.jpg', '.jpeg'})
+
 
 def setup_page():
     """Configure the Streamlit page."""
@@ -34,21 +37,119 @@ def setup_page():
     """)
 
 
-def create_download_link(img_bytes, filename):
-    """Create a download link for processed images."""
-    b64_img = base64.b64encode(img_bytes).decode()
-    href = f'<a href="data:image/png;base64,{b64_img}" download="{filename}">📥 Download Cropped Image</a>'
-    return href
+@st.cache_resource(show_spinner="Initializing Check Resizer...")
+def get_resizer():
+    """Return the CheckResizer shared by every session (it holds no per-user state)."""
+    return CheckResizer()
+
+
+# Streamlit samples large arrays when hashing them; hash every byte instead so
+# crops that differ only slightly never share a cached download
+@st.cache_data(show_spinner=False, max_entries=16,
+               hash_funcs={np.ndarray: lambda a: (a.shape, a.dtype.str, a.tobytes())})
+def encode_download(image, file_ext, optimize_size=False):
+    """Encode a BGR or grayscale image as JPEG ('.jpg') or PNG for download, cached per image.
+    
+    By default favours encoding speed; optimize_size trades speed for smaller files.
+    """
+    if file_ext == '.jpg':
+        params = [cv2.IMWRITE_JPEG_QUALITY, 95, cv2.IMWRITE_JPEG_OPTIMIZE, int(optimize_size)]
+    elif optimize_size:
+        params = [cv2.IMWRITE_PNG_COMPRESSION, 9]
+    else:
+        params = [cv2.IMWRITE_PNG_COMPRESSION, 1, cv2.IMWRITE_PNG_STRATEGY, cv2.IMWRITE_PNG_STRATEGY_FILTERED]
+    
+    ok, buffer = cv2.imencode(file_ext, image, params)
+    if not ok:
+        raise ValueError(f"Could not encode image as {file_ext}")
+    return buffer.tobytes()
+
+
+def preview_image(image, width):
+    """Encode an image array as a JPEG preview at its displayed width.
+
+    st.image passes JPEG bytes no wider than width straight to the browser,
+    so it neither resizes nor re-encodes the preview. Downloads keep full
+    resolution.
+    """
+    height, image_width = image.shape[:2]
+    if image_width > width:
+        image = cv2.resize(image, (width, int(height * width / image_width)), interpolation=cv2.INTER_AREA)
+    ok, buffer = cv2.imencode('.jpg', image, [cv2.IMWRITE_JPEG_QUALITY, 90])
+    if not ok:
+        raise ValueError("Could not encode preview image")
+    return buffer.tobytes()
+
+
+def upload_key(raw_bytes):
+    """Return a content key for uploaded bytes.
+    
+    Computed once per run and passed to the cached helpers below, which take
+    the bytes themselves as an unhashed (underscore) argument, so a large
+    upload is hashed once instead of on every cached call.
+    """
+    return hashlib.blake2b(raw_bytes, digest_size=16).hexdigest()
+
+
+# The upload caches are shared by every session and each entry holds full-size
+# image arrays (tens of MB for a phone photo), so keep only a few, briefly
+@st.cache_data(show_spinner=False, max_entries=4, ttl=600)
+def decode_upload(key, _raw_bytes):
+    """Decode uploaded image bytes to a BGR array, cached per upload key."""
+    # Keep the stored pixel orientation, as PIL does, so both views of the image line up
+    cv_image = cv2.imdecode(np.frombuffer(_raw_bytes, np.uint8), cv2.IMREAD_COLOR | cv2.IMREAD_IGNORE_ORIENTATION)
+    if cv_image is None:
+        raise ValueError("Could not decode the uploaded image")
+    return cv_image
 
 
-def process_image_ui(uploaded_file, resizer, level_background=False, level_method='morphological', level_intensity='gentle', auto_rotate=True):
+@st.cache_data(show_spinner=False, max_entries=4, ttl=600)
+def analyze_upload(key, _raw_bytes, _resizer, auto_rotate, level_background, level_method, level_intensity):
+    """Rotate, level and find crop bounds for an upload.
+    
+    Cached on the upload key and processing settings, so reruns caused by
+    other widgets skip the work. Returns (rotated image, rotation applied,
+    analysis image, its grayscale version, bounds, analysis debug output).
+    """
+    cv_image = decode_upload(key, _raw_bytes)
+    
+    rotation_applied = 0
+    if auto_rotate:
+        cv_image, rotation_applied = _resizer.rotate_image_if_needed(cv_image, auto_rotate=True)
+    
+    if level_background:
+        analysis_image = _resizer.level_image_background(cv_image, method=level_method, intensity=level_intensity)
+    else:
+        analysis_image = cv_image
+    
+    # Computed once here; analyze_image and the failure statistics both use it
+    if len(analysis_image.shape) == 3:
+        gray_image = cv2.cvtColor(analysis_image, cv2.COLOR_BGR2GRAY)
+    else:
+        gray_image = analysis_image
+    
+    # Keep the analysis messages for the debug view (bounded, newest kept)
+    debug_log = deque(maxlen=1000)
+    bounds = _resizer.analyze_image(analysis_image, log=debug_log.append, gray=gray_image)
+    
+    return cv_image, rotation_applied, analysis_image, gray_image, bounds, "\n".join(debug_log)
+
+
+def process_image_ui(uploaded_file, resizer, level_background=False, level_method='morphological', level_intensity='gentle', auto_rotate=True, optimize_size=False):
     """Process uploaded image and display results."""
     try:
-        # Convert uploaded file to PIL Image
-        pil_image = Image.open(uploaded_file)
+        raw_bytes = uploaded_file.getvalue()
+        key = upload_key(raw_bytes)
         
-        # Convert PIL to OpenCV for processing
-        cv_image = cv2.cvtColor(np.array(pil_image), cv2.COLOR_RGB2BGR)
+        # Output format and name follow the uploaded file
+        upload_path = Path(uploaded_file.name)
+        is_jpeg = upload_path.suffix.lower() in _JPEG_EXTS
+        file_ext = '.jpg' if is_jpeg else '.png'
+        mime = 'image/jpeg' if is_jpeg else 'image/png'
+        original_name = upload_path.stem
+        
+        # PIL only reads the header here; pixels are loaded just for manual cropping
+        pil_image = Image.open(io.BytesIO(raw_bytes))
         
         # Check if manual crop mode is enabled
         if st.session_state.get('manual_crop_mode', False):
@@ -90,25 +191,19 @@ def process_image_ui(uploaded_file, resizer, level_background=False, level_metho
                     st.subheader("💾 Download Manually Cropped Image")
                     
                     # Convert to bytes for download
-                    img_bytes = io.BytesIO()
-                    if uploaded_file.name.lower().endswith(('.jpg', '.jpeg')):
-                        cropped_img.save(img_bytes, format='JPEG', quality=95)
-                        file_ext = '.jpg'
-                    else:
-                        cropped_img.save(img_bytes, format='PNG')
-                        file_ext = '.png'
-                    
-                    img_bytes = img_bytes.getvalue()
+                    if cropped_img.mode != 'RGB':
+                        cropped_img = cropped_img.convert('RGB')
+                    cropped_bgr = cv2.cvtColor(np.asarray(cropped_img), cv2.COLOR_RGB2BGR)
+                    img_bytes = encode_download(cropped_bgr, file_ext, optimize_size)
                     
                     # Create download filename
-                    original_name = Path(uploaded_file.name).stem
                     download_filename = f"{original_name}_manual_crop{file_ext}"
                     
                     st.download_button(
                         label="📥 Download Manually Cropped Image",
                         data=img_bytes,
                         file_name=download_filename,
-                        mime=f"image/{'jpeg' if file_ext == '.jpg' else 'png'}"
+                        mime=mime
                     )
                     
                     # Options to try automatic again
@@ -131,118 +226,101 @@ def process_image_ui(uploaded_file, resizer, level_background=False, level_metho
                     st.rerun()
                 return False
         
+        # Manual cropping works from the PIL image; decode only for the automatic path
+        cv_image = decode_upload(key, raw_bytes)
+        
         # Show original image info
         st.subheader("📋 Original Image")
         col1, col2 = st.columns([2, 1])
         
         with col1:
-            st.image(pil_image, caption="Original Check Image", width=400)
+            st.image(preview_image(cv_image, 400), caption="Original Check Image", width=400)
         
         with col2:
-            st.write("**Image Information:**")
-            st.write(f"- **Filename:** {uploaded_file.name}")
-            st.write(f"- **Size:** {pil_image.size[0]} × {pil_image.size[1]} pixels")
-            st.write(f"- **Format:** {pil_image.format}")
-            st.write(f"- **Mode:** {pil_image.mode}")
+            file_size = len(raw_bytes)
             
-            # File size
-            file_size = len(uploaded_file.getvalue())
-            st.write(f"- **File Size:** {file_size:,} bytes ({file_size/1024:.1f} KB)")
+            # One markdown block per list, so each is a single element update
+            st.markdown(
+                f"**Image Information:**\n"
+                f"- **Filename:** {uploaded_file.name}\n"
+                f"- **Size:** {pil_image.size[0]} × {pil_image.size[1]} pixels\n"
+                f"- **Format:** {pil_image.format}\n"
+                f"- **Mode:** {pil_image.mode}\n"
+                f"- **File Size:** {file_size:,} bytes ({file_size/1024:.1f} KB)"
+            )
         
         # Process the image
         st.subheader("⚙️ Processing Image...")
         
         # Show processing options being used
-        st.write(f"**Processing Settings:**")
-        st.write(f"- Auto-rotation: {'✅ Enabled' if auto_rotate else '❌ Disabled'}")
-        st.write(f"- Background leveling: {'✅ Enabled' if level_background else '❌ Disabled'}")
+        settings = [
+            "**Processing Settings:**",
+            f"- Auto-rotation: {'✅ Enabled' if auto_rotate else '❌ Disabled'}",
+            f"- Background leveling: {'✅ Enabled' if level_background else '❌ Disabled'}",
+        ]
         if level_background:
-            st.write(f"- Leveling method: {level_method.title()}")
-            st.write(f"- Intensity: {level_intensity.title()}")
+            settings.append(f"- Leveling method: {level_method.title()}")
+            settings.append(f"- Intensity: {level_intensity.title()}")
+        st.markdown("\n".join(settings))
         
         # Add debug option
         show_debug = st.checkbox("Show debug information", value=False, help="Display detailed processing information")
         
         with st.spinner("Analyzing image and finding optimal crop boundaries..."):
-            # Apply auto-rotation if requested
-            if auto_rotate:
-                cv_image, rotation_applied = resizer.rotate_image_if_needed(cv_image, auto_rotate=True)
-                if rotation_applied > 0:
-                    st.info(f"🔄 Auto-rotated image {rotation_applied}° for horizontal orientation")
-                    
-                    # Update PIL image to match rotation
-                    if len(cv_image.shape) == 3:
-                        pil_image = Image.fromarray(cv2.cvtColor(cv_image, cv2.COLOR_BGR2RGB))
-                    else:
-                        pil_image = Image.fromarray(cv_image, mode='L')
+            cv_image, rotation_applied, analysis_image, gray_image, bounds, debug_output = analyze_upload(
+                key, raw_bytes, resizer, auto_rotate, level_background, level_method, level_intensity
+            )
+            
+            if rotation_applied > 0:
+                st.info(f"🔄 Auto-rotated image {rotation_applied}° for horizontal orientation")
             
-            # Apply background leveling if requested
             if level_background:
-                st.info(f"🎚️ Applying {level_intensity} {level_method} background leveling...")
-                leveled_cv = resizer.level_image_background(cv_image, method=level_method, intensity=level_intensity)
-                
-                # Convert back to PIL for display
-                if len(leveled_cv.shape) == 3:
-                    leveled_pil = Image.fromarray(cv2.cvtColor(leveled_cv, cv2.COLOR_BGR2RGB))
-                else:
-                    leveled_pil = Image.fromarray(leveled_cv, mode='L')
-                
-                # Use leveled image for analysis
-                analysis_image = leveled_cv
-                display_image = leveled_pil
-            else:
-                analysis_image = cv_image
-                display_image = pil_image
+                st.info(f"🎚️ Applied {level_intensity} {level_method} background leveling")
             
-            # Find optimal boundaries
             if show_debug:
                 st.write("**Debug Information:**")
-                debug_container = st.container()
-            
-            # Capture print output for debug
-            if show_debug:
-                f = io.StringIO()
-                with redirect_stdout(f):
-                    bounds = resizer.analyze_image(analysis_image)
-                debug_output = f.getvalue()
-                with debug_container:
-                    if debug_output:
-                        st.text(debug_output)
-            else:
-                bounds = resizer.analyze_image(analysis_image)
+                if debug_output:
+                    st.text(debug_output)
             
             if bounds is None:
                 st.error("❌ Could not determine crop boundaries.")
                 
                 # Provide helpful suggestions
-                st.write("**Possible solutions:**")
-                st.write("1. **Image Quality**: Ensure the image has good contrast and lighting")
-                st.write("2. **Check Content**: Make sure the check has clear visible boundaries")
-                st.write("3. **File Format**: Try saving the image in a different format (PNG recommended)")
-                st.write("4. **Resolution**: Use a higher resolution scan (at least 300 DPI)")
-                st.write("5. **Preprocessing**: Try adjusting the image brightness/contrast before uploading")
+                st.markdown(
+                    "**Possible solutions:**\n"
+                    "1. **Image Quality**: Ensure the image has good contrast and lighting\n"
+                    "2. **Check Content**: Make sure the check has clear visible boundaries\n"
+                    "3. **File Format**: Try saving the image in a different format (PNG recommended)\n"
+                    "4. **Resolution**: Use a higher resolution scan (at least 300 DPI)\n"
+                    "5. **Preprocessing**: Try adjusting the image brightness/contrast before uploading"
+                )
                 
                 # Show image analysis
                 st.subheader("🔍 Image Analysis")
-                gray_image = cv2.cvtColor(cv_image, cv2.COLOR_BGR2GRAY)
                 
                 col1, col2 = st.columns(2)
                 with col1:
                     st.write("**Grayscale Version:**")
-                    st.image(gray_image, caption="Converted to grayscale", width=300, channels="GRAY")
+                    st.image(preview_image(gray_image, 300), caption="Converted to grayscale", width=300)
                 
                 with col2:
-                    st.write("**Image Statistics:**")
-                    st.write(f"- Mean brightness: {np.mean(gray_image):.1f}")
-                    st.write(f"- Brightness std: {np.std(gray_image):.1f}")
-                    st.write(f"- Min brightness: {np.min(gray_image)}")
-                    st.write(f"- Max brightness: {np.max(gray_image)}")
+                    # One pass for mean/std and one for min/max
+                    mean, std = (float(v[0, 0]) for v in cv2.meanStdDev(gray_image))
+                    min_brightness, max_brightness, _, _ = cv2.minMaxLoc(gray_image)
+                    
+                    st.markdown(
+                        f"**Image Statistics:**\n"
+                        f"- Mean brightness: {mean:.1f}\n"
+                        f"- Brightness std: {std:.1f}\n"
+                        f"- Min brightness: {int(min_brightness)}\n"
+                        f"- Max brightness: {int(max_brightness)}"
+                    )
                     
                     # Suggest if image is too uniform
-                    if np.std(gray_image) < 20:
+                    if std < 20:
                         st.warning("⚠️ Low contrast detected - try improving image contrast")
                     
-                    if np.mean(gray_image) > 200:
+                    if mean > 200:
                         st.warning("⚠️ Image appears very bright - check may not be clearly visible")
                 
                 # Offer manual cropping option
@@ -258,12 +336,13 @@ def process_image_ui(uploaded_file, resizer, level_background=False, level_metho
             x1, y1, x2, y2 = bounds
             
             # Calculate statistics
-            original_area = pil_image.size[0] * pil_image.size[1]
+            original_height, original_width = cv_image.shape[:2]
+            original_area = original_width * original_height
             cropped_area = (x2 - x1) * (y2 - y1)
             area_reduction = (original_area - cropped_area) / original_area * 100
             
-            # Crop the image
-            cropped_image = display_image.crop((x1, y1, x2, y2))
+            # Crop the image as an array view; it is shown and encoded as is
+            cropped_bgr = analysis_image[y1:y2, x1:x2]
         
         # Show processing results
         st.success("✅ Image processed successfully!")
@@ -273,7 +352,7 @@ def process_image_ui(uploaded_file, resizer, level_background=False, level_metho
         
         col1, col2, col3 = st.columns(3)
         with col1:
-            st.metric("Original Dimensions", f"{pil_image.size[0]} × {pil_image.size[1]}")
+            st.metric("Original Dimensions", f"{original_width} × {original_height}")
         with col2:
             st.metric("Cropped Dimensions", f"{x2-x1} × {y2-y1}")
         with col3:
@@ -290,44 +369,33 @@ def process_image_ui(uploaded_file, resizer, level_background=False, level_metho
             
             with col1:
                 st.write("**1. Original Image**")
-                st.image(pil_image, caption="Original with background variations", width=300)
+                st.image(preview_image(cv_image, 300), caption="Original with background variations", width=300)
             
             with col2:
                 st.write(f"**2. Leveled ({level_method}, {level_intensity})**")
-                st.image(display_image, caption="Background leveled", width=300)
+                st.image(preview_image(analysis_image, 300), caption="Background leveled", width=300)
             
             with col3:
                 st.write("**3. Final Cropped**")
-                st.image(cropped_image, caption="Cropped to content", width=300)
+                st.image(preview_image(cropped_bgr, 300), caption="Cropped to content", width=300)
         else:
             col1, col2 = st.columns(2)
             
             with col1:
                 st.write("**Original Image**")
-                st.image(pil_image, caption="Original with whitespace", width=350)
+                st.image(preview_image(cv_image, 350), caption="Original with whitespace", width=350)
             
             with col2:
                 st.write("**Cropped Image**")
-                st.image(cropped_image, caption="Cropped to content", width=350)
+                st.image(preview_image(cropped_bgr, 350), caption="Cropped to content", width=350)
         
         # Download section
         st.subheader("💾 Download Results")
         
         # Convert cropped image to bytes for download
-        img_bytes = io.BytesIO()
-        
-        # Determine output format
-        if uploaded_file.name.lower().endswith(('.jpg', '.jpeg')):
-            cropped_image.save(img_bytes, format='JPEG', quality=95)
-            file_ext = '.jpg'
-        else:
-            cropped_image.save(img_bytes, format='PNG')
-            file_ext = '.png'
-        
-        img_bytes = img_bytes.getvalue()
+        img_bytes = encode_download(cropped_bgr, file_ext, optimize_size)
         
         # Create download filename
-        original_name = Path(uploaded_file.name).stem
         download_filename = f"{original_name}_cropped{file_ext}"
         
         # Download button
@@ -335,17 +403,19 @@ def process_image_ui(uploaded_file, resizer, level_background=False, level_metho
             label="📥 Download Cropped Image",
             data=img_bytes,
             file_name=download_filename,
-            mime=f"image/{'jpeg' if file_ext == '.jpg' else 'png'}"
+            mime=mime
         )
         
         # File size comparison
         cropped_size = len(img_bytes)
         size_reduction = (file_size - cropped_size) / file_size * 100
         
-        st.write(f"**File Size Comparison:**")
-        st.write(f"- Original: {file_size:,} bytes ({file_size/1024:.1f} KB)")
-        st.write(f"- Cropped: {cropped_size:,} bytes ({cropped_size/1024:.1f} KB)")
-        st.write(f"- Size Reduction: {size_reduction:.1f}%")
+        st.markdown(
+            f"**File Size Comparison:**\n"
+            f"- Original: {file_size:,} bytes ({file_size/1024:.1f} KB)\n"
+            f"- Cropped: {cropped_size:,} bytes ({cropped_size/1024:.1f} KB)\n"
+            f"- Size Reduction: {size_reduction:.1f}%"
+        )
         
         return True
         
@@ -365,6 +435,13 @@ def show_processing_options():
         help="Automatically detect and correct image orientation"
     )
     
+    # Download encoding option
+    optimize_size = st.sidebar.checkbox(
+        "💾 Optimize file size (slower)",
+        value=False,
+        help="Compress downloads harder for smaller files, at the cost of slower encoding"
+    )
+    
     # Background leveling options
     leveling_section = st.sidebar.expander("🎚️ Background Leveling", expanded=True)
     with leveling_section:
@@ -389,21 +466,24 @@ def show_processing_options():
                 help="How aggressively to apply leveling"
             )
             
-            st.write("**Method descriptions:**")
-            st.write("• **Morphological**: Best for most documents")
-            st.write("• **Gaussian**: Fast, good for simple backgrounds") 
-            st.write("• **Polynomial**: Advanced, handles complex lighting")
+            st.markdown("""
+            **Method descriptions:**
+            - **Morphological**: Best for most documents
+            - **Gaussian**: Fast, good for simple backgrounds
+            - **Polynomial**: Advanced, handles complex lighting
             
-            st.write("**Intensity levels:**")
-            st.write("• **Gentle**: Minimal distortion (recommended)")
-            st.write("• **Medium**: Balanced correction")
-            st.write("• **Strong**: Maximum background removal")
+            **Intensity levels:**
+            - **Gentle**: Minimal distortion (recommended)
+            - **Medium**: Balanced correction
+            - **Strong**: Maximum background removal
+            """)
         else:
             level_method = "morphological"
             level_intensity = "gentle"
     
     # Store in session state
     st.session_state.auto_rotate = auto_rotate
+    st.session_state.optimize_size = optimize_size
     st.session_state.level_background = level_background
     st.session_state.level_method = level_method if level_background else "morphological"
     st.session_state.level_intensity = level_intensity if level_background else "gentle"
@@ -457,11 +537,7 @@ def main():
     level_background, level_method, level_intensity = show_processing_options()
     
     # Initialize the resizer
-    if 'resizer' not in st.session_state:
-        with st.spinner("Initializing Check Resizer..."):
-            st.session_state.resizer = CheckResizer()
-    
-    resizer = st.session_state.resizer
+    resizer = get_resizer()
     
     # File upload section
     st.header("📤 Upload Check Image")
@@ -478,9 +554,10 @@ def main():
         level_bg = st.session_state.get('level_background', False)
         level_meth = st.session_state.get('level_method', 'morphological')
         level_intens = st.session_state.get('level_intensity', 'gentle')
+        optimize_size = st.session_state.get('optimize_size', False)
         
         # Process the uploaded image
-        process_image_ui(uploaded_file, resizer, level_bg, level_meth, level_intens, auto_rot)
+        process_image_ui(uploaded_file, resizer, level_bg, level_meth, level_intens, auto_rot, optimize_size)
     
     else:
         # Show example/demo section when no file is uploaded
@@ -511,45 +588,36 @@ def main():
                 
                 # Import demo functionality
                 from demo import create_sample_check
-                import tempfile
-                import os
                 
-                # Create a temporary sample check
-                with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp_file:
-                    create_sample_check(tmp_file.name, check_size=(500, 200), canvas_size=(800, 600))
-                    
-                    # Load and process the sample
-                    sample_image = Image.open(tmp_file.name)
+                # Create the sample check in memory
+                cv_sample = create_sample_check(check_size=(500, 200), canvas_size=(800, 600))
+                
+                st.write("**Sample Check Image:**")
+                st.image(cv_sample, caption="Sample check with whitespace", width=400, channels="BGR")
+                
+                # Process it
+                bounds = resizer.analyze_image(cv_sample)
+                
+                if bounds:
+                    x1, y1, x2, y2 = bounds
+                    cropped_sample = cv_sample[y1:y2, x1:x2]
                     
-                    st.write("**Sample Check Image:**")
-                    st.image(sample_image, caption="Sample check with whitespace", width=400)
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        st.write("**Before (with whitespace):**")
+                        st.image(cv_sample, caption="Original", width=300, channels="BGR")
                     
-                    # Process it
-                    cv_sample = cv2.cvtColor(np.array(sample_image), cv2.COLOR_RGB2BGR)
-                    bounds = resizer.analyze_image(cv_sample)
+                    with col2:
+                        st.write("**After (cropped):**")
+                        st.image(cropped_sample, caption="Cropped", width=300, channels="BGR")
                     
-                    if bounds:
-                        x1, y1, x2, y2 = bounds
-                        cropped_sample = sample_image.crop((x1, y1, x2, y2))
-                        
-                        col1, col2 = st.columns(2)
-                        with col1:
-                            st.write("**Before (with whitespace):**")
-                            st.image(sample_image, caption="Original", width=300)
-                        
-                        with col2:
-                            st.write("**After (cropped):**")
-                            st.image(cropped_sample, caption="Cropped", width=300)
-                        
-                        # Calculate reduction
-                        original_area = sample_image.size[0] * sample_image.size[1]
-                        cropped_area = (x2 - x1) * (y2 - y1)
-                        reduction = (original_area - cropped_area) / original_area * 100
-                        
-                        st.success(f"✅ Demo completed! Area reduction: {reduction:.1f}%")
+                    # Calculate reduction
+                    sample_height, sample_width = cv_sample.shape[:2]
+                    original_area = sample_width * sample_height
+                    cropped_area = (x2 - x1) * (y2 - y1)
+                    reduction = (original_area - cropped_area) / original_area * 100
                     
-                    # Cleanup
-                    os.unlink(tmp_file.name)
+                    st.success(f"✅ Demo completed! Area reduction: {reduction:.1f}%")
         
         # Instructions
         st.markdown("---")